@@ -14,18 +14,32 @@ Examples::
     envyronment.MissingEnvironmentVariableError: Environment variable MY_STR is not set.
 """
 
+from __future__ import annotations
+
+import enum
 import json
 import os
-from collections.abc import Callable
 from pathlib import Path
-from typing import TypeVar
+from typing import TYPE_CHECKING, Any, Literal, TypeVar
+
+if TYPE_CHECKING:
+    from collections.abc import Callable
+
+# The flag is stored on the os module so it survives re-imports of this module. Unlike an environment variable it is
+# not inherited by child processes, which load their own .env. The trade-off is a private, prefixed attribute added to
+# the os module namespace.
+_DOTENV_LOADED = "_envyronment_dotenv_loaded"
 
-try:
-    from dotenv import load_dotenv  # type: ignore[reportMissingImports]
-except ImportError:
-    """Could not import dotenv.load_dotenv."""
-else:
-    load_dotenv()
+if not getattr(os, _DOTENV_LOADED, False):
+    try:
+        from dotenv import load_dotenv  # type: ignore[reportMissingImports]
+    except ImportError:
+        """Could not import dotenv.load_dotenv."""
+    else:
+        load_dotenv()
+        setattr(os, _DOTENV_LOADED, True)
+
+_ENVIRON = os.environ
 
 T = TypeVar("T")
 
@@ -33,16 +47,68 @@ T = TypeVar("T")
 class MissingEnvironmentVariableError(Exception):
     """Raised when an environment variable is missing."""
 
+    def __init__(self, *args: object, name: str | None = None):
+        """Initialize the error with a message, or with the name of the missing variable.
+
+        When only name is given, args holds the name and the message is formatted when the error is converted to str.
+        """
+        self._format_name = not args and name is not None
+        super().__init__(*args or ((name,) if self._format_name else ()))
+        self.name = name
 
-class _Missing:
+    def __str__(self):
+        """Return the error message."""
+        if not self._format_name:
+            return super().__str__()
+        return f"Environment variable {self.name} is not set."
+
+    def __repr__(self):
+        """Return a representation including the message."""
+        if not self._format_name:
+            return super().__repr__()
+        return f"{type(self).__name__}({str(self)!r})"
+
+
+class _Missing(enum.Enum):
     """Sentinel to represent a missing value."""
 
+    MISSING = enum.auto()
+
+    def __repr__(self):
+        """Return a short representation, used in signatures shown by help()."""
+        return "<MISSING>"
+
 
-_MISSING = _Missing()
+_MISSING = _Missing.MISSING
+
+_BOOL_VALUES: dict[str, bool] = {
+    "true": True,
+    "1": True,
+    "yes": True,
+    "on": True,
+    "false": False,
+    "0": False,
+    "no": False,
+    "off": False,
+}
+# Also map the common casings so they are found without normalizing the value first. Other values (e.g. " yes ") pay
+# for a second lookup after strip().lower(), which is slower than normalizing up front; this is accepted.
+_BOOL_MAP: dict[str, bool] = {
+    form(key): flag for key, flag in _BOOL_VALUES.items() for form in (str.lower, str.upper, str.capitalize)
+}
+
+_JSON_DECODER = json.JSONDecoder()
+
+_MATERIALIZED_FILES: set[str] = set()
+_MATERIALIZED_DIRS: set[str] = set()
 
 
 def read(
-    name: str, default: T | _Missing = _MISSING, *, astype: Callable[..., T] = str, convert_default: bool = False
+    name: str,
+    default: T | Literal[_Missing.MISSING] = _MISSING,
+    *,
+    astype: Callable[..., T] = str,
+    convert_default: bool = False,
 ) -> T:
     """Read a value from the environment and call astype with the value as argument.
 
@@ -53,17 +119,80 @@ def read(
 
     Note: astype must be able to accept a single str argument.
     """
-    try:
-        value = os.environ[name]
-    except KeyError as exc:
-        if isinstance(default, _Missing):
-            raise MissingEnvironmentVariableError(f"Environment variable {name} is not set.") from exc
+    value = _ENVIRON.get(name, _MISSING)
+    if value is _MISSING:
+        if default is _MISSING:
+            raise MissingEnvironmentVariableError(name=name)
         if convert_default:
             return astype(default)
         return default
+    if astype is str:
+        return value  # type: ignore[reportReturnType]
     return astype(value)
 
 
+def read_str(name: str, default: T | Literal[_Missing.MISSING] = _MISSING) -> str | T:
+    """Read a value from the environment as str.
+
+    Behaves like read(name, default) without the astype and convert_default handling.
+    """
+    value = _ENVIRON.get(name, _MISSING)
+    if value is _MISSING:
+        if default is _MISSING:
+            raise MissingEnvironmentVariableError(name=name)
+        return default
+    return value
+
+
+def read_int(name: str, default: T | Literal[_Missing.MISSING] = _MISSING) -> int | T:
+    """Read a value from the environment and convert it to int.
+
+    Behaves like read(name, default, astype=int). The default value is returned as is.
+    """
+    value = _ENVIRON.get(name, _MISSING)
+    if value is _MISSING:
+        if default is _MISSING:
+            raise MissingEnvironmentVariableError(name=name)
+        return default
+    return int(value)
+
+
+def read_bool(name: str, default: T | Literal[_Missing.MISSING] = _MISSING) -> bool | T:
+    """Read a value from the environment and convert it using to_bool.
+
+    Behaves like read(name, default, astype=to_bool). The default value is returned as is.
+    """
+    value = _ENVIRON.get(name, _MISSING)
+    if value is _MISSING:
+        if default is _MISSING:
+            raise MissingEnvironmentVariableError(name=name)
+        return default
+    return to_bool(value)
+
+
+def read_many(spec: dict[str, Callable[[str], Any] | tuple[Callable[[str], Any], Any]]) -> dict[str, Any]:
+    """Read multiple values from the environment in one call.
+
+    spec maps each variable name to either astype, for a required variable, or a tuple of (astype, default).
+    Returns a dict mapping each name to its converted value, or to its default when the variable is not set.
+    A MissingEnvironmentVariableError will be raised for the first required variable that is not set.
+
+    Errors raised by astype will propagate to the caller.
+    """
+    environ = _ENVIRON
+    values: dict[str, Any] = {}
+    for name, item in spec.items():
+        astype, default = item if isinstance(item, tuple) else (item, _MISSING)
+        value = environ.get(name, _MISSING)
+        if value is _MISSING:
+            if default is _MISSING:
+                raise MissingEnvironmentVariableError(name=name)
+            values[name] = default
+        else:
+            values[name] = value if astype is str else astype(value)
+    return values
+
+
 def to_bool(value: str) -> bool:
     """Convert a string to a boolean.
 
@@ -71,15 +200,14 @@ def to_bool(value: str) -> bool:
     Recognizes 'false', '0', 'no', 'off' (case-insensitive) as False.
     Raises ValueError for unrecognized values.
     """
-    true_values = {"true", "1", "yes", "on"}
-    false_values = {"false", "0", "no", "off"}
-
-    value_lower = value.strip().lower()
-    if value_lower in true_values:
-        return True
-    if value_lower in false_values:
-        return False
-    raise ValueError(f"Cannot convert '{value}' to bool. True values: {true_values}. False values: {false_values}.")
+    result = _BOOL_MAP.get(value)
+    if result is None:
+        result = _BOOL_VALUES.get(value.strip().lower())
+    if result is None:
+        true_values = {key for key, flag in _BOOL_VALUES.items() if flag}
+        false_values = {key for key, flag in _BOOL_VALUES.items() if not flag}
+        raise ValueError(f"Cannot convert '{value}' to bool. True values: {true_values}. False values: {false_values}.")
+    return result
 
 
 def to_json(value: str):
@@ -87,7 +215,7 @@ def to_json(value: str):
 
     This can be used to convert to dict, list, etc., depending on the JSON structure.
     """
-    return json.loads(value)
+    return _JSON_DECODER.decode(value)
 
 
 def to_list(value: str) -> list[str]:
@@ -96,18 +224,38 @@ def to_list(value: str) -> list[str]:
 
 
 def to_filepath(value: str | Path):
-    """Convert the value to a Path and ensure the file and its parents exist."""
-    path = Path(value)
-    path.parent.mkdir(parents=True, exist_ok=True)
-    path.touch(exist_ok=True)
-    return path
+    """Convert the value to a Path and ensure the file and its parents exist.
+
+    Paths are only created once per process, a file removed afterwards is not recreated.
+    """
+    path = os.fspath(value)
+    key = os.path.abspath(path)
+    if key not in _MATERIALIZED_FILES:
+        parent = os.path.dirname(path)
+        if parent:
+            os.makedirs(parent, exist_ok=True)
+        try:
+            os.utime(path, None)
+        except OSError:
+            os.close(os.open(path, os.O_CREAT | os.O_WRONLY, 0o666))
+        _MATERIALIZED_FILES.add(key)
+    return Path(path)
 
 
 def to_dirpath(value: str | Path):
     """Convert the value to a Path and ensure the directory exists.
 
-    Prints a warning if the directory could not be created.
+    Paths are only created once per process, a directory removed afterwards is not recreated.
     """
-    path = Path(value)
-    path.mkdir(parents=True, exist_ok=True)
-    return path
+    path = os.fspath(value)
+    key = os.path.abspath(path)
+    if key not in _MATERIALIZED_DIRS:
+        os.makedirs(path, exist_ok=True)
+        _MATERIALIZED_DIRS.add(key)
+    return Path(path)
+
+
+def _reset_fs_cache() -> None:
+    """Forget which paths were created by to_filepath and to_dirpath."""
+    _MATERIALIZED_FILES.clear()
+    _MATERIALIZED_DIRS.clear()
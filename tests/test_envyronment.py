@@ -2,6 +2,8 @@
 
 import importlib
 import json
+import os
+import pickle
 import sys
 import types
 import unittest
@@ -9,6 +11,8 @@ from pathlib import Path
 from tempfile import TemporaryDirectory
 from unittest.mock import Mock, patch
 
+from envyronment import _DOTENV_LOADED
+
 
 class EnvTests(unittest.TestCase):
     """Tests for envyronment.py module."""
@@ -16,6 +20,7 @@ class EnvTests(unittest.TestCase):
     def setUp(self):
         """Set up test environment."""
         self.env_module = importlib.import_module("envyronment")
+        self.env_module._reset_fs_cache()
 
     def test_read_existing_variable(self):
         """Test reading an existing environment variable."""
@@ -32,8 +37,29 @@ class EnvTests(unittest.TestCase):
     def test_read_missing_variable_without_default(self):
         """Test reading a missing environment variable without a default value."""
         with patch.dict("os.environ", {}, clear=True):
-            with self.assertRaises(self.env_module.MissingEnvironmentVariableError):
+            with self.assertRaises(self.env_module.MissingEnvironmentVariableError) as ctx:
                 self.env_module.read("MISSING_VAR")
+            self.assertEqual(ctx.exception.name, "MISSING_VAR")
+            self.assertEqual(str(ctx.exception), "Environment variable MISSING_VAR is not set.")
+            self.assertEqual(
+                repr(ctx.exception), "MissingEnvironmentVariableError('Environment variable MISSING_VAR is not set.')"
+            )
+            self.assertEqual(ctx.exception.args, ("MISSING_VAR",))
+
+    def test_missing_environment_variable_error_message(self):
+        """Test that MissingEnvironmentVariableError can still be raised with a custom message."""
+        error = self.env_module.MissingEnvironmentVariableError("custom message")
+        self.assertEqual(str(error), "custom message")
+        self.assertEqual(repr(error), "MissingEnvironmentVariableError('custom message')")
+        self.assertIsNone(error.name)
+
+        error = self.env_module.MissingEnvironmentVariableError()
+        self.assertEqual(str(error), "")
+        self.assertEqual(error.args, ())
+
+        error = pickle.loads(pickle.dumps(self.env_module.MissingEnvironmentVariableError(name="MISSING_VAR")))
+        self.assertEqual(error.name, "MISSING_VAR")
+        self.assertEqual(str(error), "Environment variable MISSING_VAR is not set.")
 
     def test_read_with_astype_error(self):
         """Test that errors from astype propagate."""
@@ -41,6 +67,51 @@ class EnvTests(unittest.TestCase):
             with self.assertRaises(ValueError):
                 self.env_module.read("TEST_VAR", astype=int)
 
+    def test_read_str(self):
+        """Test the read_str function."""
+        with patch.dict("os.environ", {"TEST_VAR": "abc"}, clear=True):
+            self.assertEqual(self.env_module.read_str("TEST_VAR"), "abc")
+            self.assertEqual(self.env_module.read_str("MISSING_VAR", "default_value"), "default_value")
+            with self.assertRaises(self.env_module.MissingEnvironmentVariableError):
+                self.env_module.read_str("MISSING_VAR")
+
+    def test_read_int(self):
+        """Test the read_int function."""
+        with patch.dict("os.environ", {"TEST_VAR": "123", "BAD_VAR": "abc"}, clear=True):
+            self.assertEqual(self.env_module.read_int("TEST_VAR"), 123)
+            self.assertEqual(self.env_module.read_int("MISSING_VAR", 42), 42)
+            with self.assertRaises(self.env_module.MissingEnvironmentVariableError):
+                self.env_module.read_int("MISSING_VAR")
+            with self.assertRaises(ValueError):
+                self.env_module.read_int("BAD_VAR")
+
+    def test_read_bool(self):
+        """Test the read_bool function."""
+        with patch.dict("os.environ", {"TEST_VAR": "yes", "BAD_VAR": "maybe"}, clear=True):
+            self.assertTrue(self.env_module.read_bool("TEST_VAR"))
+            self.assertFalse(self.env_module.read_bool("MISSING_VAR", False))
+            with self.assertRaises(self.env_module.MissingEnvironmentVariableError):
+                self.env_module.read_bool("MISSING_VAR")
+            with self.assertRaises(ValueError):
+                self.env_module.read_bool("BAD_VAR")
+
+    def test_read_many(self):
+        """Test the read_many function."""
+        with patch.dict("os.environ", {"STR_VAR": "abc", "INT_VAR": "123", "BOOL_VAR": "no"}, clear=True):
+            result = self.env_module.read_many(
+                {
+                    "STR_VAR": str,
+                    "INT_VAR": int,
+                    "BOOL_VAR": (self.env_module.to_bool, True),
+                    "MISSING_VAR": (int, 42),
+                }
+            )
+            self.assertEqual(result, {"STR_VAR": "abc", "INT_VAR": 123, "BOOL_VAR": False, "MISSING_VAR": 42})
+
+            with self.assertRaises(self.env_module.MissingEnvironmentVariableError) as ctx:
+                self.env_module.read_many({"STR_VAR": str, "MISSING_VAR": int})
+            self.assertEqual(ctx.exception.name, "MISSING_VAR")
+
     def test_to_bool(self):
         """Test the to_bool function."""
         true_values = ["true", "1", "yes", "on"]
@@ -49,10 +120,14 @@ class EnvTests(unittest.TestCase):
         for val in true_values:
             self.assertTrue(self.env_module.to_bool(val))
             self.assertTrue(self.env_module.to_bool(val.upper()))
+            self.assertTrue(self.env_module.to_bool(val.capitalize()))
+            self.assertTrue(self.env_module.to_bool(f" {val.swapcase()}\n"))
 
         for val in false_values:
             self.assertFalse(self.env_module.to_bool(val))
             self.assertFalse(self.env_module.to_bool(val.upper()))
+            self.assertFalse(self.env_module.to_bool(val.capitalize()))
+            self.assertFalse(self.env_module.to_bool(f" {val.swapcase()}\n"))
 
         with self.assertRaises(ValueError):
             self.env_module.to_bool("maybe")
@@ -73,6 +148,9 @@ class EnvTests(unittest.TestCase):
         result = self.env_module.to_list(csv_string)
         self.assertEqual(result, ["apple", "banana", "cherry", "dragon fruit"])
 
+        self.assertEqual(self.env_module.to_list(" apple ,, banana , ,cherry, "), ["apple", "banana", "cherry"])
+        self.assertEqual(self.env_module.to_list("  "), [])
+
     def test_to_filepath(self):
         """Test the to_filepath function."""
         with TemporaryDirectory() as tmpdir:
@@ -99,6 +177,34 @@ class EnvTests(unittest.TestCase):
             self.assertEqual(str(result_nested), nested_filepath_str)
             self.assertTrue(nested_filepath.is_file())
 
+            # Ensure the file is only created once
+            with patch("os.open") as os_open:
+                self.env_module.to_filepath(nested_filepath_str)
+            os_open.assert_not_called()
+
+    def test_to_filepath_bare_filename(self):
+        """Test that a bare filename is created in the working directory."""
+        cwd = os.getcwd()
+        with TemporaryDirectory() as tmpdir:
+            try:
+                os.chdir(tmpdir)
+                result = self.env_module.to_filepath("file.txt")
+            finally:
+                os.chdir(cwd)
+            self.assertEqual(result, Path("file.txt"))
+            self.assertTrue((Path(tmpdir) / "file.txt").is_file())
+
+    def test_to_filepath_read_only_file(self):
+        """Test that an existing read-only file is not opened for writing."""
+        with TemporaryDirectory() as tmpdir:
+            filepath = Path(tmpdir) / "secret.pem"
+            filepath.touch()
+            filepath.chmod(0o444)
+            with patch("os.open", wraps=os.open) as os_open:
+                result = self.env_module.to_filepath(str(filepath))
+            os_open.assert_not_called()
+            self.assertEqual(result, filepath)
+
     def test_to_dirpath(self):
         """Test the to_dirpath function."""
         with TemporaryDirectory() as tmpdir:
@@ -125,6 +231,25 @@ class EnvTests(unittest.TestCase):
             self.assertEqual(str(result_nested_dir), nested_dirpath_str)
             self.assertTrue(nested_dirpath.is_dir())
 
+            # Ensure the directory is only created once
+            with patch("os.makedirs") as makedirs:
+                self.env_module.to_dirpath(nested_dirpath_str)
+            makedirs.assert_not_called()
+
+    def test_to_dirpath_relative_to_working_directory(self):
+        """Test that relative paths are created again after changing the working directory."""
+        cwd = os.getcwd()
+        with TemporaryDirectory() as tmpdir_a, TemporaryDirectory() as tmpdir_b:
+            try:
+                os.chdir(tmpdir_a)
+                self.assertEqual(self.env_module.to_dirpath("logs"), Path("logs"))
+                os.chdir(tmpdir_b)
+                self.assertEqual(self.env_module.to_dirpath("logs"), Path("logs"))
+            finally:
+                os.chdir(cwd)
+            self.assertTrue((Path(tmpdir_a) / "logs").is_dir())
+            self.assertTrue((Path(tmpdir_b) / "logs").is_dir())
+
     def test_convert_default_arg(self):
         """Test that the default argument is also converted when convert_default is True."""
         with patch.dict("os.environ", {}, clear=True):
@@ -144,6 +269,17 @@ class EnvLoadDotenvTests(unittest.TestCase):
     def setUp(self):
         """Set up test environment."""
         sys.modules.pop("envyronment", None)  # Ensure our module isn't already imported
+        self._forget_dotenv_loaded()  # Ensure .env is not considered loaded
+
+    def tearDown(self):
+        """Clean up test environment."""
+        self._forget_dotenv_loaded()
+
+    @staticmethod
+    def _forget_dotenv_loaded():
+        """Remove the flag that marks .env as loaded."""
+        if hasattr(os, _DOTENV_LOADED):
+            delattr(os, _DOTENV_LOADED)
 
     def test_load_dotenv_called_if_available(self):
         """Test that load_dotenv() is called if python-dotenv is available."""
@@ -155,6 +291,21 @@ class EnvLoadDotenvTests(unittest.TestCase):
 
         fake_dotenv.load_dotenv.assert_called_once()
 
+    def test_load_dotenv_called_once(self):
+        """Test that load_dotenv() is not called again when the module is re-imported."""
+        fake_dotenv = types.SimpleNamespace()
+        fake_dotenv.load_dotenv = Mock()
+        environ_keys = set(os.environ)
+
+        with patch.dict(sys.modules, {"dotenv": fake_dotenv}):
+            importlib.import_module("envyronment")
+            sys.modules.pop("envyronment", None)
+            importlib.import_module("envyronment")
+
+        fake_dotenv.load_dotenv.assert_called_once()
+        self.assertIs(getattr(os, _DOTENV_LOADED), True)
+        self.assertEqual(set(os.environ), environ_keys)  # Nothing is inherited by child processes
+
     def test_no_dotenv_import(self):
         """Test that module still imports if python-dotenv is missing."""
         with patch.dict(sys.modules, {"dotenv": None}):